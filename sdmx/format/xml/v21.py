@@ -1,5 +1,7 @@
 """Information about the SDMX-ML 2.1 file format."""
 
+import sys
+
 from sdmx.model import v21
 
 from .common import XMLFormat
@@ -34,7 +36,9 @@ FORMAT = XMLFormat(
         ("model.EndPeriod", "com:EndPeriod"),
     ]
     + [
-        (f"model.{name}", f"str:{name}")
+        # Intern the constructed strings; unlike the literals above, f-string results
+        # are not interned automatically
+        (sys.intern(f"model.{name}"), sys.intern(f"str:{name}"))
         for name in """
             CodelistMap
             CodeMap
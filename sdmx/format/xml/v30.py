@@ -1,5 +1,7 @@
 """Information about the SDMX-ML 3.0 file format."""
 
+import sys
+
 from sdmx.model import v30
 
 from .common import XMLFormat
@@ -18,7 +20,9 @@ FORMAT = XMLFormat(
         ("model.MetadataSet", "mes:MetadataSet"),
     ]
     + [
-        (f"model.{name}", f"str:{name}")
+        # Intern the constructed strings; unlike the literals above, f-string results
+        # are not interned automatically
+        (sys.intern(f"model.{name}"), sys.intern(f"str:{name}"))
         for name in """
             ExclusiveCodeSelection
             InclusiveCodeSelection
@@ -1,21 +1,24 @@
 """Information related to the SDMX-REST web service standard."""
 
 import abc
+import functools
 import re
-from copy import copy
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import TYPE_CHECKING, Any, ClassVar, Mapping, Optional
+import sys
+from typing import TYPE_CHECKING, AbstractSet, Any, ClassVar, Mapping, Optional
 from urllib.parse import urlsplit, urlunsplit
 
 if TYPE_CHECKING:
     import sdmx.source
 
-# Mapping from Resource value to class name.
+# Mapping from Resource value to class name. Keys and values are interned so that the
+# per-URL-build lookups in class_name()/from_obj() hash pre-interned strings.
 CLASS_NAME = {
-    "dataflow": "DataflowDefinition",
-    "datastructure": "DataStructureDefinition",
-    "metadatastructure": "MetadataStructureDefinition",
+    sys.intern(k): sys.intern(v)
+    for k, v in {
+        "dataflow": "DataflowDefinition",
+        "datastructure": "DataStructureDefinition",
+        "metadatastructure": "MetadataStructureDefinition",
+    }.items()
 }
 
 # Inverse of :data:`CLASS_NAME`.
@@ -37,8 +40,93 @@ RESPONSE_CODE = {
     503: "Unavailable",
 }
 
+#: Dense table backing :func:`response_text`: index ``code - 200`` gives the text for
+#: `code`, or :obj:`None` where the standard defines none. Built once at import.
+_RESPONSE_TEXT = tuple(RESPONSE_CODE.get(200 + i) for i in range(304))
 
-class Resource(str, Enum):
+
+def response_text(code: int) -> Optional[str]:
+    """Return the text defined by the SDMX-REST standard for HTTP status `code`.
+
+    Texts for the common codes (200, 400, 404, …) are served from a precomputed,
+    contiguous tuple by index rather than hashing into :data:`RESPONSE_CODE`. Returns
+    :obj:`None` for codes the standard does not define.
+    """
+    i = code - 200
+    return _RESPONSE_TEXT[i] if 0 <= i < len(_RESPONSE_TEXT) else None
+
+
+@functools.lru_cache(maxsize=256)
+def _to_camel(name: str) -> str:
+    """Convert `name` from snake_case to lowerCamelCase.
+
+    Each "_" directly followed by a lowercase letter is dropped and the letter
+    upper-cased, as with the regular expression :py:`r"_([a-z])"`; other characters
+    pass through. The set of parameter names is small and fixed, so results are cached
+    and shared across all :class:`.QueryParameter` instances.
+    """
+    chars = []
+    i, n = 0, len(name)
+    while i < n:
+        c = name[i]
+        if c == "_" and i + 1 < n and "a" <= name[i + 1] <= "z":
+            chars.append(name[i + 1].upper())
+            i += 2
+        else:
+            chars.append(c)
+            i += 1
+    return "".join(chars)
+
+
+@functools.lru_cache(maxsize=None)
+def _base_url(source_url: str) -> str:
+    """Return the scheme, netloc, and path of `source_url`, ending with "/".
+
+    Splitting and re-joining the base URL is done at most once per source, rather than
+    on every :meth:`.URL.join` call.
+    """
+    scheme, netloc, path = urlsplit(source_url)[:3]
+    path = re.sub("([^/])$", r"\1/", path) or "/"
+    return urlunsplit((scheme, netloc, path, "", ""))
+
+
+@functools.lru_cache(maxsize=None)
+def _split_path(expr: str) -> tuple[str, ...]:
+    """Split a "/"-delimited path expression, caching the result.
+
+    The expressions passed by the :py:`URL.handle_…()` methods are drawn from a small,
+    fixed set, so each is split at most once per process. Parts are interned to match
+    the interned keys of :data:`PARAM` and the version-specific equivalents.
+    """
+    return tuple(map(sys.intern, expr.split("/")))
+
+
+@functools.lru_cache(maxsize=None)
+def _split_query(expr: str) -> tuple[str, ...]:
+    """Split a space-delimited query parameter expression, caching the result."""
+    return tuple(map(sys.intern, expr.split()))
+
+
+class _ResourceMeta(type):
+    """Metaclass for :class:`.Resource`.
+
+    Provides enum-like iteration over and item access to the members, via a plain
+    :class:`dict` that avoids :class:`enum.EnumMeta` dispatch overhead.
+    """
+
+    _lookup: dict[str, "Resource"]
+
+    def __iter__(cls):
+        return iter(cls._lookup.values())
+
+    def __len__(cls):
+        return len(cls._lookup)
+
+    def __getitem__(cls, name) -> "Resource":
+        return cls._lookup[name]
+
+
+class Resource(str, metaclass=_ResourceMeta):
     """Enumeration of SDMX-REST API resources.
 
     This class merges the "resources" defined in Section V of the SDMX 2.1 and 3.0
@@ -46,8 +134,14 @@ class Resource(str, Enum):
     structure) are used as the first part of a URL path; however, the choice of this
     first part and allowable query parameters depend on the more detailed list.
 
+    Formerly a :class:`str`-:class:`~enum.Enum`; now a plain :class:`str` subclass
+    whose members are :func:`sys.intern`-ed singletons, which preserves the enum-like
+    API (iteration, :py:`Resource[name]`, :attr:`name`/:attr:`value`, identity and
+    equality with plain strings) while avoiding per-access :class:`~enum.Enum`
+    machinery on every URL build.
+
     ============================= ======================================================
-    :class:`Enum` member          :mod:`sdmx.model` class
+    Member                        :mod:`sdmx.model` class
     ============================= ======================================================
     ``actualconstraint``          :class:`.ContentConstraint`
     ``agencyscheme``              :class:`.AgencyScheme`
@@ -87,46 +181,79 @@ class Resource(str, Enum):
 
     """  # noqa: E501
 
-    actualconstraint = "actualconstraint"
-    agencyscheme = "agencyscheme"
-    allowedconstraint = "allowedconstraint"
-    attachementconstraint = "attachementconstraint"
-    availableconstraint = "availableconstraint"
-    categorisation = "categorisation"
-    categoryscheme = "categoryscheme"
-    codelist = "codelist"
-    conceptscheme = "conceptscheme"
-    contentconstraint = "contentconstraint"
-    customtypescheme = "customtypescheme"
-    data = "data"
-    dataconsumerscheme = "dataconsumerscheme"
-    dataflow = "dataflow"
-    dataproviderscheme = "dataproviderscheme"
-    datastructure = "datastructure"
-    hierarchicalcodelist = "hierarchicalcodelist"
-    metadata = "metadata"
-    metadataflow = "metadataflow"
-    metadatastructure = "metadatastructure"
-    namepersonalisationscheme = "namepersonalisationscheme"
-    organisationscheme = "organisationscheme"
-    organisationunitscheme = "organisationunitscheme"
-    process = "process"
-    provisionagreement = "provisionagreement"
-    registration = "registration"
-    reportingtaxonomy = "reportingtaxonomy"
-    rulesetscheme = "rulesetscheme"
-    schema = "schema"
-    structure = "structure"
-    structureset = "structureset"
-    transformationscheme = "transformationscheme"
-    userdefinedoperatorscheme = "userdefinedoperatorscheme"
-    vtlmappingscheme = "vtlmappingscheme"
+    #: Name of the member; identical to :attr:`value`.
+    name: str
+    #: String value of the member.
+    value: str
+
+    #: Mapping from member name to member, for :py:`Resource[name]` access.
+    _lookup: ClassVar[dict[str, "Resource"]] = {}
+
+    #: Precomputed result of :meth:`describe`.
+    _describe: ClassVar[str]
+
+    #: Cache of :meth:`from_obj` results, keyed by the class of `obj`.
+    _from_class: ClassVar[dict[type, "Resource"]] = {}
+
+    # Members; created by the loop below the class body
+    actualconstraint: ClassVar["Resource"]
+    agencyscheme: ClassVar["Resource"]
+    allowedconstraint: ClassVar["Resource"]
+    attachementconstraint: ClassVar["Resource"]
+    availableconstraint: ClassVar["Resource"]
+    categorisation: ClassVar["Resource"]
+    categoryscheme: ClassVar["Resource"]
+    codelist: ClassVar["Resource"]
+    conceptscheme: ClassVar["Resource"]
+    contentconstraint: ClassVar["Resource"]
+    customtypescheme: ClassVar["Resource"]
+    data: ClassVar["Resource"]
+    dataconsumerscheme: ClassVar["Resource"]
+    dataflow: ClassVar["Resource"]
+    dataproviderscheme: ClassVar["Resource"]
+    datastructure: ClassVar["Resource"]
+    hierarchicalcodelist: ClassVar["Resource"]
+    metadata: ClassVar["Resource"]
+    metadataflow: ClassVar["Resource"]
+    metadatastructure: ClassVar["Resource"]
+    namepersonalisationscheme: ClassVar["Resource"]
+    organisationscheme: ClassVar["Resource"]
+    organisationunitscheme: ClassVar["Resource"]
+    process: ClassVar["Resource"]
+    provisionagreement: ClassVar["Resource"]
+    registration: ClassVar["Resource"]
+    reportingtaxonomy: ClassVar["Resource"]
+    rulesetscheme: ClassVar["Resource"]
+    schema: ClassVar["Resource"]
+    structure: ClassVar["Resource"]
+    structureset: ClassVar["Resource"]
+    transformationscheme: ClassVar["Resource"]
+    userdefinedoperatorscheme: ClassVar["Resource"]
+    vtlmappingscheme: ClassVar["Resource"]
+
+    def __new__(cls, value: str) -> "Resource":
+        # Return the existing member for `value`; like Enum, do not create new instances
+        return cls._lookup[value]
+
+    def __reduce__(self):
+        return (self.__class__, (str(self),))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     @classmethod
     def from_obj(cls, obj):
         """Return an enumeration value based on the class of `obj`."""
-        value = obj.__class__.__name__
-        return cls[VALUE.get(value, value)]
+        klass = type(obj)
+        try:
+            return cls._from_class[klass]
+        except KeyError:
+            value = klass.__name__
+            member = cls._from_class[klass] = cls[VALUE.get(value, value)]
+            return member
 
     @classmethod
     def class_name(cls, value: "Resource", default=None) -> str:
@@ -138,31 +265,103 @@ class Resource(str, Enum):
 
     @classmethod
     def describe(cls):
-        return "{" + " ".join(v.name for v in cls._member_map_.values()) + "}"
+        return cls._describe
+
+
+for _name in (
+    "actualconstraint",
+    "agencyscheme",
+    "allowedconstraint",
+    "attachementconstraint",
+    "availableconstraint",
+    "categorisation",
+    "categoryscheme",
+    "codelist",
+    "conceptscheme",
+    "contentconstraint",
+    "customtypescheme",
+    "data",
+    "dataconsumerscheme",
+    "dataflow",
+    "dataproviderscheme",
+    "datastructure",
+    "hierarchicalcodelist",
+    "metadata",
+    "metadataflow",
+    "metadatastructure",
+    "namepersonalisationscheme",
+    "organisationscheme",
+    "organisationunitscheme",
+    "process",
+    "provisionagreement",
+    "registration",
+    "reportingtaxonomy",
+    "rulesetscheme",
+    "schema",
+    "structure",
+    "structureset",
+    "transformationscheme",
+    "userdefinedoperatorscheme",
+    "vtlmappingscheme",
+):
+    _name = sys.intern(_name)
+    _member = str.__new__(Resource, _name)
+    _member.name = _member.value = _name
+    Resource._lookup[_name] = _member
+    setattr(Resource, _name, _member)
+
+del _member, _name
+
+# Member names are fixed once the loop above completes, so compute this only once
+Resource._describe = "{" + " ".join(Resource._lookup) + "}"
+
+
+#: Shared sentinel for :attr:`Parameter.values` when no allowable values are given.
+#: Immutable, so a single instance can be shared by every parameter.
+_NO_VALUES: frozenset = frozenset()
 
 
-@dataclass
 class Parameter(abc.ABC):
-    """SDMX query parameter."""
+    """SDMX query parameter.
+
+    A plain class with :py:`__slots__`, rather than a dataclass, to reduce per-instance
+    memory and speed up attribute access in :meth:`handle`.
+    """
+
+    __slots__ = ("name", "values", "default", "_has_values")
 
     #: Keyword argument to :class:`.URL` understood by this parameter.
     name: str
 
     #: Allowable values.
-    values: set = field(default_factory=set)
+    values: AbstractSet
 
     #: Default value.
-    default: Optional[str] = None
+    default: Optional[str]
+
+    def __init__(
+        self,
+        name: str,
+        values: Optional[AbstractSet] = None,
+        default: Optional[str] = None,
+    ):
+        # Intern the name so that per-call dict operations hash a pre-interned string
+        self.name = sys.intern(name)
+        self.values = values if values else _NO_VALUES
+        self.default = default
+        # Computed once so that handle() can skip validation without sizing the set
+        self._has_values = bool(self.values)
 
     @abc.abstractmethod
     def handle(self, parameters: dict[str, Any]) -> dict[str, str]:
         """Return a dict to update :attr:`.URL.path` or :attr:`.URL.query`."""
 
 
-@dataclass
 class PathParameter(Parameter):
     """SDMX query parameter appearing as a part of the path component of a URL."""
 
+    __slots__ = ()
+
     def handle(self, parameters):
         """Return a length-1 dict to update :attr:`.URL.path`."""
         # Retrieve the value from `parameters`
@@ -171,29 +370,30 @@ class PathParameter(Parameter):
         # Check against allowable values
         if value is None:
             raise ValueError(f"Missing required parameter {self.name!r}")
-        elif len(self.values) and value not in self.values:
+        elif self._has_values and value not in self.values:
             raise ValueError(f"{self.name}={value!r} not among {self.values}")
 
         # Return
         return {self.name: value}
 
 
-@dataclass
 class OptionalPath(Parameter):
     """Like :class:`.PathParameter`, but optional.
 
     If the corresponding keyword is missing
     """
 
+    __slots__ = ()
+
     def handle(self, parameters):
         if value := parameters.pop(self.name, None):
-            assert value in self.values or 0 == len(self.values)
+            if self._has_values and value not in self.values:
+                raise ValueError(f"{self.name}={value!r} not among {self.values}")
             return {self.name: value}
         else:
             return {}
 
 
-@dataclass
 class QueryParameter(PathParameter):
     """SDMX query parameter appearing as part of the query string component of a URL.
 
@@ -201,31 +401,41 @@ class QueryParameter(PathParameter):
     :attr:`.name` is :py:`"foo_bar"`.
     """
 
-    def __post_init__(self):
+    __slots__ = ("camelName",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
         # Convert self.name to lowerCamelCase as appearing in query strings
-        self.camelName = re.sub(r"_([a-z])", lambda x: x.group(1).upper(), self.name)
+        self.camelName = sys.intern(_to_camel(self.name))
 
     def handle(self, parameters):
         """Return a length-0 or -1 dict to update :attr:`.URL.query`."""
-        if present := {self.name, self.camelName} & set(parameters):
-            if 2 == len(present):
-                raise ValueError(f"Cannot give both {self.name} and {self.camelName}")
+        # Containment checks on the dict directly; both names are interned
+        name_given = self.name in parameters
+        camel_given = self.camelName in parameters
 
-            value = parameters.pop(present.pop())
-            if value is None:
-                return {}
-            elif len(self.values) and value not in self.values:
-                raise ValueError(f"{self.name}={value!r} not among {self.values}")
-
-            return {self.camelName: value}
+        if name_given:
+            if camel_given and self.name != self.camelName:
+                raise ValueError(f"Cannot give both {self.name} and {self.camelName}")
+            value = parameters.pop(self.name)
+        elif camel_given:
+            value = parameters.pop(self.camelName)
         else:
             return {}
 
+        if value is None:
+            return {}
+        elif self._has_values and value not in self.values:
+            raise ValueError(f"{self.name}={value!r} not among {self.values}")
+
+        return {self.camelName: value}
+
 
-@dataclass
 class PositiveIntParam(QueryParameter):
     """A query parameter that must be a positive integer."""
 
+    __slots__ = ()
+
     def handle(self, parameters):
         result = super().handle(parameters)
         try:
@@ -246,31 +456,36 @@ class PositiveIntParam(QueryParameter):
 # - common:NCNameIDType
 # - common:VersionType
 
+#: Keys are interned (like :attr:`Parameter.name`) so that the per-URL-build lookups
+#: via :attr:`URL._all_parameters` compare pointers after hashing.
 PARAM: dict[str, Parameter] = {
-    # Path parameters
-    "agency_id": PathParameter("agency_id"),
-    "key": OptionalPath("key"),
-    "resource_id": PathParameter("resource_id", set(), "all"),
-    #
-    # Query parameters
-    "dimension_at_observation": QueryParameter("dimension_at_observation"),
-    "first_n_observations": PositiveIntParam("first_n_observations"),
-    "include_history": QueryParameter("include_history", {True, False}),
-    "last_n_observations": PositiveIntParam("last_n_observations"),
-    "mode": QueryParameter("mode", {"available", "exact"}),
-    "references_a": QueryParameter(
-        "references",
-        {
-            "all",
-            "codelist",
-            "conceptscheme",
-            "dataflow",
-            "dataproviderscheme",
-            "datastructure",
-            "none",
-        },
-    ),
-    "updated_after": QueryParameter("updated_after"),  # Also availability
+    sys.intern(k): v
+    for k, v in {
+        # Path parameters
+        "agency_id": PathParameter("agency_id"),
+        "key": OptionalPath("key"),
+        "resource_id": PathParameter("resource_id", set(), "all"),
+        #
+        # Query parameters
+        "dimension_at_observation": QueryParameter("dimension_at_observation"),
+        "first_n_observations": PositiveIntParam("first_n_observations"),
+        "include_history": QueryParameter("include_history", {True, False}),
+        "last_n_observations": PositiveIntParam("last_n_observations"),
+        "mode": QueryParameter("mode", {"available", "exact"}),
+        "references_a": QueryParameter(
+            "references",
+            {
+                "all",
+                "codelist",
+                "conceptscheme",
+                "dataflow",
+                "dataproviderscheme",
+                "datastructure",
+                "none",
+            },
+        ),
+        "updated_after": QueryParameter("updated_after"),  # Also availability
+    }.items()
 }
 
 #: Common lists of names used in both :data:`.v21.PARAM` and :data:`.v30.PARAM`. The
@@ -302,6 +517,53 @@ NAMES = {
 }
 
 
+#: Mapping from :attr:`Resource.name` to the name of the :py:`URL.handle_…()` method
+#: for that query type. Both sides are interned constants built once at import, so no
+#: string formatting happens per URL build; names not appearing here are structure
+#: queries.
+_HANDLER_NAME: dict[str, str] = {
+    sys.intern(name): sys.intern(f"handle_{name}")
+    for name in ("data", "metadata", "registration", "schema", "structure")
+}
+_HANDLER_NAME["availableconstraint"] = sys.intern("handle_availability")
+
+_HANDLE_STRUCTURE = _HANDLER_NAME["structure"]
+
+
+@functools.lru_cache(maxsize=None)
+def _path_params(cls: type["URL"], expr: str) -> tuple:
+    """Resolve a "/"-delimited path expression against `cls`'s parameters.
+
+    Returns a tuple whose items are either :class:`Parameter` instances (for parts like
+    :py:`"{param}"`) or plain path parts. Resolution—splitting, stripping braces, and
+    the `_all_parameters` lookups—happens at most once per (URL subclass, expression)
+    pair.
+    """
+    return tuple(
+        cls._all_parameters[part.strip("{}")] if part.startswith("{") else part
+        for part in _split_path(expr)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _query_params(cls: type["URL"], expr: str) -> tuple:
+    """Resolve a space-delimited query parameter expression against `cls`.
+
+    Like :func:`_path_params`, but every part names a :class:`Parameter`.
+    """
+    return tuple(map(cls._all_parameters.__getitem__, _split_query(expr)))
+
+
+@functools.lru_cache(maxsize=None)
+def _handler(cls: type, name: str):
+    """Return the method of `cls` that handles queries for the resource type `name`.
+
+    The getattr() walk over the class MRO happens at most once per (URL subclass,
+    resource type) pair, rather than on every URL construction.
+    """
+    return getattr(cls, _HANDLER_NAME.get(name, _HANDLE_STRUCTURE))
+
+
 class URL(abc.ABC):
     """Abstract base utility class to build SDMX-REST API URLs.
 
@@ -331,40 +593,42 @@ class URL(abc.ABC):
 
     _all_parameters: ClassVar[Mapping[Any, Parameter]]
 
+    def __init_subclass__(cls, **kwargs):
+        """Freeze :attr:`_all_parameters` into a plain :class:`dict`.
+
+        Subclasses declare the mapping as a :class:`~collections.ChainMap` over
+        :data:`PARAM` and their version-specific additions; flattening it here keeps
+        every later lookup a single dict probe instead of a walk over the chained
+        maps. :class:`dict` construction from a ChainMap preserves its resolution
+        order, so earlier maps still take precedence for duplicated keys.
+        """
+        super().__init_subclass__(**kwargs)
+        all_parameters = cls.__dict__.get("_all_parameters")
+        if all_parameters is not None and not isinstance(all_parameters, dict):
+            cls._all_parameters = dict(all_parameters)
+
     def __init__(self, source: "sdmx.source.Source", resource_type: Resource, **kwargs):
-        # Check for duplicates in kwargs["params"] and kwargs directly
-        params = copy(kwargs)
-        params_dict = params.pop("params", {})
-        if overlap := set(params) & set(params_dict):
+        # Check for duplicates in kwargs["params"] and kwargs directly. `kwargs` is
+        # already a fresh dict built by the ** calling convention, so consume it
+        # directly rather than copying
+        params_dict = kwargs.pop("params", {})
+        if overlap := kwargs.keys() & params_dict:
             raise ValueError(f"Duplicate values for query parameters {overlap}")
-        params.update(params_dict)
+        kwargs.update(params_dict)
 
         self.source = source
         self.resource_type = resource_type
 
         # Store the keyword arguments
-        self._params = params
+        self._params = kwargs
 
         # Internal
-        self._path = dict()
-        self.query = dict()
-
-        # Identify the query type
-        if resource_type.name in {
-            "data",
-            "metadata",
-            "schema",
-            "structure",
-            "registration",
-        }:
-            query_type = resource_type.name
-        elif resource_type.name in {"availableconstraint"}:
-            query_type = "availability"
-        else:
-            query_type = "structure"
+        self._path = {}
+        self.query = {}
 
-        # Dispatch to a method appropriate to the Version and QueryType
-        getattr(self, f"handle_{query_type}")()
+        # Identify the query type and dispatch to the appropriate method for the
+        # Version and QueryType
+        _handler(type(self), resource_type.name)(self)
 
         if len(self._params):
             raise ValueError(f"Unexpected/unhandled parameters {self._params}")
@@ -380,17 +644,20 @@ class URL(abc.ABC):
           :attr:`._all_parameters``, and the resulting :class:`.Parameter` instance
           consumes a keyword argument.
         - Parts that are plain strings like :py:`"foo"` are passed through directly.
+
+        Resolution of `expr` to :class:`.Parameter` instances is cached; see
+        :func:`_path_params`.
         """
-        for part in expr.split("/"):
-            if part.startswith("{"):
-                param = self._all_parameters[part.strip("{}")]
-                self._path.update(param.handle(self._params))
+        for part in _path_params(type(self), expr):
+            if isinstance(part, str):
+                # Plain part; avoid constructing a temporary 1-element dict
+                self._path[part] = None
             else:
-                self._path.update({part: None})
+                self._path.update(part.handle(self._params))
 
     def handle_query_params(self, expr: str) -> None:
         """Extend :attr:`.query` with parts from `expr`, a " "-delimited string."""
-        for p in map(self._all_parameters.__getitem__, expr.split()):
+        for p in _query_params(type(self), expr):
             self.query.update(p.handle(self._params))
 
     # Handlers for different QueryTypes
@@ -432,19 +699,17 @@ class URL(abc.ABC):
         with_query : bool
             If :any:`False`, omit :attr:`.query` from the joined URL.
         """
-        # Keep the URL scheme, netloc, and any path from the source's base URL
-        parts = list(urlsplit(self.source.url)[:3]) + [None, None]
-
-        # Assemble path string
-        parts[2] = re.sub("([^/])$", r"\1/", parts[2] or "") + "/".join(
-            (value or name) for name, value in self._path.items()
+        # Append the assembled path to the (cached) base URL from the source. Pass
+        # str.join a list: joining an iterator forces an extra internal pass/copy
+        url = _base_url(self.source.url) + "/".join(
+            [(value or name) for name, value in self._path.items()]
         )
 
-        if with_query:
-            # Assemble query string
-            parts[3] = "&".join(f"{k}={v}" for k, v in self.query.items())
+        if with_query and self.query:
+            # Append the assembled query string
+            url = url + "?" + "&".join([f"{k}={v}" for k, v in self.query.items()])
 
-        return urlunsplit(parts)
+        return url
 
     @property
     def rt(self) -> str:
@@ -8,33 +8,39 @@ specification
 for further details.
 """
 
+import sys
 from collections import ChainMap
 from warnings import warn
 
 from . import common
 from .common import OptionalPath, PathParameter, QueryParameter, Resource
 
-#: v1.5.0-specific path and query parameters.
+#: v1.5.0-specific path and query parameters. Keys are interned as in
+#: :data:`.common.PARAM`.
 PARAM: dict[str, common.Parameter] = {
-    # Path parameters
-    # NB the text and YAML OpenAPI specification disagree on whether this is required
-    "component_id": OptionalPath("component_id"),
-    "context": PathParameter("context", common.NAMES["context"]),
-    "flow": OptionalPath("resource_id"),
-    "provider": OptionalPath("provider"),
-    "version": PathParameter("version", set(), "latest"),
-    #
-    # Query parameters
-    "detail_d": QueryParameter(
-        "detail", {"dataonly", "full", "nodata", "serieskeysonly"}
-    ),
-    "detail_s": QueryParameter("detail", common.NAMES["detail_s"]),
-    "references_s": QueryParameter(
-        "references", common.NAMES["references_s"] | set(Resource)
-    ),
-    "start_period": QueryParameter("start_period"),
-    "end_period": QueryParameter("end_period"),
-    "explicit_measure": QueryParameter("explicit_measure", {True, False}),
+    sys.intern(k): v
+    for k, v in {
+        # Path parameters
+        # NB the text and YAML OpenAPI specification disagree on whether this is
+        #    required
+        "component_id": OptionalPath("component_id"),
+        "context": PathParameter("context", common.NAMES["context"]),
+        "flow": OptionalPath("resource_id"),
+        "provider": OptionalPath("provider"),
+        "version": PathParameter("version", set(), "latest"),
+        #
+        # Query parameters
+        "detail_d": QueryParameter(
+            "detail", {"dataonly", "full", "nodata", "serieskeysonly"}
+        ),
+        "detail_s": QueryParameter("detail", common.NAMES["detail_s"]),
+        "references_s": QueryParameter(
+            "references", common.NAMES["references_s"] | set(Resource)
+        ),
+        "start_period": QueryParameter("start_period"),
+        "end_period": QueryParameter("end_period"),
+        "explicit_measure": QueryParameter("explicit_measure", {True, False}),
+    }.items()
 }
 
 
@@ -7,35 +7,40 @@ SDMX standards. See the `documentation
 details.
 """
 
+import sys
 from collections import ChainMap
 
 from . import common
 from .common import PathParameter, QueryParameter, Resource
 
-#: v2.1.0-specific path and query parameters.
+#: v2.1.0-specific path and query parameters. Keys are interned as in
+#: :data:`.common.PARAM`.
 PARAM: dict[str, common.Parameter] = {
-    # Path parameters
-    "component_id": PathParameter("component_id"),
-    "context": PathParameter(
-        "context", common.NAMES["context"] | {"metadataprovisionagreement"}
-    ),
-    "context_d": PathParameter(
-        "context", {"datastructure", "dataflow", "provisionagreement", "*"}, "*"
-    ),
-    "provider_id": PathParameter("provider_id"),
-    "version": PathParameter("version", set(), "+"),
-    #
-    # Query parameters
-    "attributes": QueryParameter("attributes"),
-    "c": QueryParameter("c"),
-    "detail_m": QueryParameter("detail", {"allstubs", "full"}),
-    "detail_s": QueryParameter("detail", common.NAMES["detail_s"] | {"raw"}),
-    "measures": QueryParameter("measures"),
-    "references_s": QueryParameter(
-        "references", common.NAMES["references_s"] | {"ancestors"} | set(Resource)
-    ),
-    "updated_after": QueryParameter("update_after"),
-    "updated_before": QueryParameter("update_before"),
+    sys.intern(k): v
+    for k, v in {
+        # Path parameters
+        "component_id": PathParameter("component_id"),
+        "context": PathParameter(
+            "context", common.NAMES["context"] | {"metadataprovisionagreement"}
+        ),
+        "context_d": PathParameter(
+            "context", {"datastructure", "dataflow", "provisionagreement", "*"}, "*"
+        ),
+        "provider_id": PathParameter("provider_id"),
+        "version": PathParameter("version", set(), "+"),
+        #
+        # Query parameters
+        "attributes": QueryParameter("attributes"),
+        "c": QueryParameter("c"),
+        "detail_m": QueryParameter("detail", {"allstubs", "full"}),
+        "detail_s": QueryParameter("detail", common.NAMES["detail_s"] | {"raw"}),
+        "measures": QueryParameter("measures"),
+        "references_s": QueryParameter(
+            "references", common.NAMES["references_s"] | {"ancestors"} | set(Resource)
+        ),
+        "updated_after": QueryParameter("update_after"),
+        "updated_before": QueryParameter("update_before"),
+    }.items()
 }
 
 
@@ -66,7 +71,7 @@ class URL(common.URL):
 
     def handle_metadata(self):
         """Handle URL parameters for metadata endpoints."""
-        self._path.update({"metadata": None})
+        self._path["metadata"] = None
         if self.resource_type == common.Resource.metadataflow:
             self.handle_path_params(
                 "metadataflow/{agency_id}/{resource_id}/{version}/{provider_id}"
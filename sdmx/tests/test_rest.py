@@ -4,7 +4,12 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 import pytest
 
 from sdmx import Resource
-from sdmx.rest.common import PathParameter, PositiveIntParam, QueryParameter
+from sdmx.rest.common import (
+    PathParameter,
+    PositiveIntParam,
+    QueryParameter,
+    response_text,
+)
 
 if TYPE_CHECKING:
     import _pytest
@@ -30,6 +35,24 @@ class TestResource:
         )
 
 
+@pytest.mark.parametrize(
+    "code, expected",
+    [
+        # Codes defined by the standard
+        (200, "OK"),
+        (404, "Not found"),
+        (503, "Unavailable"),
+        # In-range code with no defined text
+        (201, None),
+        # Codes outside the range of the table
+        (199, None),
+        (504, None),
+    ],
+)
+def test_response_text(code, expected) -> None:
+    assert expected == response_text(code)
+
+
 class TestPathParameter:
     @pytest.fixture
     def p(self):